@@ -2,38 +2,32 @@
 
 from __future__ import annotations
 
-from functools import partial
-from typing import Callable, Dict, List, MutableMapping, cast
+from typing import Callable, Dict, List
 
 from vim_engine.modes.base_mode import ModeContext, ModeResult
 
-CommandHandler = Callable[[ModeContext, List[str]], ModeResult]
-
-
-def _command_state(context: ModeContext) -> MutableMapping[str, object]:
-    state = cast(
-        MutableMapping[str, object], context.extras.setdefault("command_state", {})
-    )
-    state.setdefault("text", "")
-    state.setdefault("history", [])
-    return state
+CommandHandler = Callable[..., ModeResult]
 
 
 def submit_command_line(context: ModeContext, match) -> ModeResult:
     del match
-    state = _command_state(context)
-    raw = str(state.get("text", ""))
-    text = raw.strip()
+    text = context.command_text.strip()
     context.bus.emit("command.submit", text)
-    history = state.get("history")
-    if isinstance(history, list):
+    history = context.command_history
+    if history is None:
+        context.command_history = [text]
+    else:
         history.append(text)
-    state["text"] = ""
+    context.command_text = ""
     if not text:
         return ModeResult(consumed=True, switch_to="normal", status="command_empty")
-    parts = text.split()
-    command = parts[0]
-    args = parts[1:]
+    command, *rest = text.split(None, 1)
+    args = rest[0].split() if rest else []
+    if command.endswith("!"):
+        handler = _FORCE_HANDLERS.get(command[:-1])
+        if handler is None:
+            return _unknown_command(context, command)
+        return handler(context, args, force=True)
     handler = _COMMAND_HANDLERS.get(command)
     if handler is None:
         return _unknown_command(context, command)
@@ -65,117 +59,96 @@ def _handle_write(
     context: ModeContext, args: List[str], *, force: bool = False
 ) -> ModeResult:
     _emit_write(context, args, force=force)
-    status = "command_write_force" if force else "command_write"
-    message = "write!" if force else "write"
-    return ModeResult(
-        consumed=True,
-        switch_to="normal",
-        status=status,
-        message=message,
-    )
+    return _command_result("write", force=force)
 
 
 def _handle_quit(
     context: ModeContext, args: List[str], *, force: bool = False
 ) -> ModeResult:
     _emit_quit(context, force=force)
-    status = "command_quit_force" if force else "command_quit"
-    message = "quit!" if force else "quit"
-    return ModeResult(
-        consumed=True,
-        switch_to="normal",
-        status=status,
-        message=message,
-    )
+    return _command_result("quit", force=force)
 
 
 def _handle_wq(
     context: ModeContext, args: List[str], *, force: bool = False
 ) -> ModeResult:
-    _emit_write(context, args, force=force)
-    _emit_quit(context, force=force)
-    status = "command_wq_force" if force else "command_wq"
-    message = "wq!" if force else "wq"
-    return ModeResult(
-        consumed=True,
-        switch_to="normal",
-        status=status,
-        message=message,
-    )
+    return _write_and_quit(context, args, "wq", force=force)
 
 
 def _handle_x(
     context: ModeContext, args: List[str], *, force: bool = False
+) -> ModeResult:
+    return _write_and_quit(context, args, "x", force=force)
+
+
+def _write_and_quit(
+    context: ModeContext, args: List[str], name: str, *, force: bool
 ) -> ModeResult:
     _emit_write(context, args, force=force)
     _emit_quit(context, force=force)
-    status = "command_x_force" if force else "command_x"
-    message = "x!" if force else "x"
-    return ModeResult(
-        consumed=True,
-        switch_to="normal",
-        status=status,
-        message=message,
-    )
+    return _command_result(name, force=force)
 
 
 def _handle_edit(
     context: ModeContext, args: List[str], *, force: bool = False
 ) -> ModeResult:
     _emit_edit(context, args, force=force)
-    status = "command_edit_force" if force else "command_edit"
-    message = "edit!" if force else "edit"
+    return _command_result("edit", force=force)
+
+
+def _command_result(name: str, *, force: bool) -> ModeResult:
     return ModeResult(
         consumed=True,
         switch_to="normal",
-        status=status,
-        message=message,
+        status=f"command_{name}_force" if force else f"command_{name}",
+        message=f"{name}!" if force else name,
     )
 
 
 def _emit_write(context: ModeContext, args: List[str], *, force: bool) -> None:
+    if not context.bus.has_subscribers("command.write"):
+        return
     payload = {
         "force": force,
-        "args": list(args),
+        "args": args,
         "snapshot": context.buffer.snapshot(),
     }
     context.bus.emit("command.write", payload)
 
 
 def _emit_quit(context: ModeContext, *, force: bool) -> None:
-    payload = {"force": force}
-    context.bus.emit("command.quit", payload)
+    if not context.bus.has_subscribers("command.quit"):
+        return
+    context.bus.emit("command.quit", {"force": force})
 
 
 def _emit_edit(context: ModeContext, args: List[str], *, force: bool) -> None:
+    if not context.bus.has_subscribers("command.edit"):
+        return
     payload = {
         "force": force,
-        "args": list(args),
+        "args": args,
         "snapshot": context.buffer.snapshot(),
     }
     context.bus.emit("command.edit", payload)
 
 
-_COMMAND_HANDLERS: Dict[str, CommandHandler] = {
-    "echo": _handle_echo,
+# Commands that accept a trailing ``!``; anything else is unknown when forced.
+_FORCE_HANDLERS: Dict[str, CommandHandler] = {
     "write": _handle_write,
     "w": _handle_write,
-    "write!": partial(_handle_write, force=True),
-    "w!": partial(_handle_write, force=True),
     "quit": _handle_quit,
     "q": _handle_quit,
-    "quit!": partial(_handle_quit, force=True),
-    "q!": partial(_handle_quit, force=True),
     "wq": _handle_wq,
-    "wq!": partial(_handle_wq, force=True),
     "x": _handle_x,
-    "x!": partial(_handle_x, force=True),
     "exit": _handle_x,
-    "exit!": partial(_handle_x, force=True),
     "edit": _handle_edit,
     "e": _handle_edit,
-    "edit!": partial(_handle_edit, force=True),
-    "e!": partial(_handle_edit, force=True),
+}
+
+_COMMAND_HANDLERS: Dict[str, CommandHandler] = {
+    "echo": _handle_echo,
+    **_FORCE_HANDLERS,
 }
 
 
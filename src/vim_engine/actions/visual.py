@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import MutableMapping, Tuple, cast
+from typing import Tuple
 
 from vim_engine.buffer import Buffer
 from vim_engine.buffer.state import Cursor
@@ -11,30 +11,36 @@ from vim_engine.modes.base_mode import ModeContext, ModeResult
 CursorVector = Tuple[int, int]
 
 
-def _visual_state(context: ModeContext) -> MutableMapping[str, Cursor]:
-    state = cast(
-        MutableMapping[str, Cursor], context.extras.setdefault("visual_state", {})
-    )
-    if "anchor" not in state:
-        state["anchor"] = context.buffer.state.cursor
-    return state
+def _visual_anchor(context: ModeContext) -> Cursor:
+    anchor = context.visual_anchor
+    if anchor is None:
+        anchor = context.visual_anchor = context.buffer.state.cursor
+    return anchor
 
 
 def _clamp_cursor(buffer: Buffer, row: int, col: int) -> Cursor:
-    lines = buffer.document.snapshot()
-    max_row = max(0, len(lines) - 1)
-    row = max(0, min(row, max_row))
-    line = lines[row]
-    col = max(0, min(col, len(line)))
+    document = buffer.document
+    if row < 0:
+        row = 0
+    elif row >= document.line_count:
+        row = document.line_count - 1
+    line_len = document.line_length(row)
+    if col < 0:
+        col = 0
+    elif col > line_len:
+        col = line_len
     return (row, col)
 
 
 def _apply_selection(context: ModeContext, target: Cursor) -> ModeResult:
-    buffer = context.buffer
-    target = _clamp_cursor(buffer, *target)
-    buffer.state.set_cursor(*target)
-    anchor = _visual_state(context)["anchor"]
-    buffer.state.set_selection(anchor, target)
+    return _select_to(context, _clamp_cursor(context.buffer, *target))
+
+
+def _select_to(context: ModeContext, target: Cursor) -> ModeResult:
+    """Extend the selection to ``target``, which must already be in bounds."""
+
+    anchor = _visual_anchor(context)
+    context.buffer.state.apply_selection(anchor, target)
     context.bus.emit("visual.selection", {"anchor": anchor, "cursor": target})
     return ModeResult(consumed=True, status="visual_select")
 
@@ -48,57 +54,63 @@ def _move_by_delta(context: ModeContext, delta: CursorVector) -> ModeResult:
 
 def extend_left(context: ModeContext, match) -> ModeResult:
     del match
-    row, col = context.buffer.state.cursor
+    buffer = context.buffer
+    row, col = buffer.state.cursor
     if col > 0:
-        return _apply_selection(context, (row, col - 1))
+        return _select_to(context, (row, col - 1))
     if row == 0:
-        return _apply_selection(context, (0, 0))
+        return _select_to(context, (0, 0))
     prev_line = row - 1
-    prev_col = len(context.buffer.document.get_line(prev_line))
-    return _apply_selection(context, (prev_line, prev_col))
+    prev_col = buffer.document.line_length(prev_line)
+    return _select_to(context, (prev_line, prev_col))
 
 
 def extend_right(context: ModeContext, match) -> ModeResult:
     del match
-    row, col = context.buffer.state.cursor
-    line = context.buffer.document.get_line(row)
-    if col < len(line):
-        return _apply_selection(context, (row, col + 1))
-    if row >= context.buffer.document.line_count - 1:
-        return _apply_selection(context, (row, len(line)))
-    return _apply_selection(context, (row + 1, 0))
+    buffer = context.buffer
+    document = buffer.document
+    row, col = buffer.state.cursor
+    line_len = document.line_length(row)
+    if col < line_len:
+        return _select_to(context, (row, col + 1))
+    if row >= document.line_count - 1:
+        return _select_to(context, (row, line_len))
+    return _select_to(context, (row + 1, 0))
 
 
 def extend_up(context: ModeContext, match) -> ModeResult:
     del match
-    row, col = context.buffer.state.cursor
+    buffer = context.buffer
+    row, col = buffer.state.cursor
     if row == 0:
-        return _apply_selection(context, (0, col))
+        return _select_to(context, (0, col))
     target_row = row - 1
-    target_col = min(col, len(context.buffer.document.get_line(target_row)))
-    return _apply_selection(context, (target_row, target_col))
+    target_col = min(col, buffer.document.line_length(target_row))
+    return _select_to(context, (target_row, target_col))
 
 
 def extend_down(context: ModeContext, match) -> ModeResult:
     del match
-    row, col = context.buffer.state.cursor
-    if row >= context.buffer.document.line_count - 1:
-        line = context.buffer.document.get_line(row)
-        return _apply_selection(context, (row, len(line)))
+    buffer = context.buffer
+    document = buffer.document
+    row, col = buffer.state.cursor
+    if row >= document.line_count - 1:
+        return _select_to(context, (row, document.line_length(row)))
     target_row = row + 1
-    target_col = min(col, len(context.buffer.document.get_line(target_row)))
-    return _apply_selection(context, (target_row, target_col))
+    target_col = min(col, document.line_length(target_row))
+    return _select_to(context, (target_row, target_col))
 
 
 def yank_selection(context: ModeContext, match) -> ModeResult:
     del match
-    selection = context.buffer.state.selection
+    buffer = context.buffer
+    selection = buffer.state.selection
     if not selection:
         return ModeResult(consumed=False, status="no_selection")
     start, end = selection
-    text = context.buffer.get_text_range(start, end)
-    register_name = context.buffer.state.active_register or '"'
-    context.buffer.registers.yank_to(register_name, text, register_type="character")
+    text = buffer.get_text_range(start, end)
+    register_name = buffer.state.active_register or '"'
+    buffer.registers.yank_to(register_name, text, register_type="character")
     context.bus.emit(
         "visual.yank",
         {"register": register_name, "text": text, "range": (start, end)},
@@ -108,15 +120,14 @@ def yank_selection(context: ModeContext, match) -> ModeResult:
 
 def swap_anchor(context: ModeContext, match) -> ModeResult:
     del match
-    state = _visual_state(context)
-    cursor = context.buffer.state.cursor
-    anchor = cast(Cursor, state.get("anchor", cursor))
-    state["anchor"] = cursor
-    context.buffer.state.set_cursor(*anchor)
-    context.buffer.state.set_selection(state["anchor"], anchor)
+    buffer_state = context.buffer.state
+    cursor = buffer_state.cursor
+    anchor = _visual_anchor(context)
+    context.visual_anchor = cursor
+    buffer_state.apply_selection(cursor, anchor)
     context.bus.emit(
         "visual.selection",
-        {"anchor": state["anchor"], "cursor": anchor, "swap": True},
+        {"anchor": cursor, "cursor": anchor, "swap": True},
     )
     return ModeResult(consumed=True, status="visual_swap")
 
@@ -152,12 +163,13 @@ def _delete_selection(context: ModeContext, *, label: str) -> str | None:
     if selection is None:
         return None
     start, end = selection
-    text = context.buffer.get_text_range(start, end)
-    register_name = context.buffer.state.active_register or '"'
-    context.buffer.registers.yank_to(register_name, text, register_type="character")
-    context.buffer.replace_range(start, end, "", label=label)
-    context.buffer.state.clear_selection()
-    _visual_state(context)["anchor"] = context.buffer.state.cursor
+    buffer = context.buffer
+    text = buffer.get_text_range(start, end)
+    register_name = buffer.state.active_register or '"'
+    buffer.registers.yank_to(register_name, text, register_type="character")
+    buffer.replace_range(start, end, "", label=label)
+    buffer.state.clear_selection()
+    context.visual_anchor = buffer.state.cursor
     context.bus.emit(
         "visual.delete",
         {
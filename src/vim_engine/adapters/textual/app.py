@@ -59,7 +59,7 @@ def create_default_manager() -> ModeManager:
     return manager
 
 
-@dataclass
+@dataclass(slots=True)
 class UIState:
     buffer_text: str = ""
     status_text: str = ""
@@ -100,6 +100,10 @@ class VimEngineApp(App[None]):
         ("ctrl+q", "quit", "Quit"),
     ]
 
+    # Keys left to the app's own bindings, and keys renamed for the engine.
+    _IGNORED_KEYS = frozenset({"ctrl+c", "ctrl+q"})
+    _SPECIAL_KEYS = {"escape": "ESC", "enter": "ENTER", "return": "ENTER"}
+
     def __init__(
         self,
         *,
@@ -135,8 +139,9 @@ class VimEngineApp(App[None]):
             update_status=self._update_status,
             show_command=self._show_command,
             handle_event=self._handle_event,
-            log=self._log_line,
         )
+        if self._requested_log_port is not None:
+            hooks.log = self._log_line
         self.adapter = TextualVimAdapter(self.manager, hooks)
         await self._maybe_start_log_stream()
         self.set_interval(0.1, self._process_timeouts)
@@ -161,16 +166,23 @@ class VimEngineApp(App[None]):
         event.stop()
 
     def _update_buffer(self, mirror: BufferMirror) -> None:
-        self._state.buffer_text = mirror.text
+        text = mirror.text
+        if text == self._state.buffer_text:
+            return
+        self._state.buffer_text = text
         if self._buffer_widget:
-            self._buffer_widget.update(self._state.buffer_text)
+            self._buffer_widget.update(text)
 
     def _update_status(self, status: str) -> None:
+        if status == self._state.status_text:
+            return
         self._state.status_text = status
         if self._status_widget:
             self._status_widget.update(status)
 
     def _show_command(self, command: str) -> None:
+        if command == self._state.command_text:
+            return
         self._state.command_text = command
         if self._command_widget:
             self._command_widget.update(f":{command}" if command else "")
@@ -196,10 +208,14 @@ class VimEngineApp(App[None]):
         self._update_status(f"Log stream @ {self._log_host}:{bound}")
         self._log_line("log stream ready")
 
-    @staticmethod
+    @classmethod
     def _normalize_key(
+        cls,
         event: events.Key,
     ) -> Optional[Tuple[str, Optional[str], Tuple[str, ...]]]:
+        key = event.key
+        if key in cls._IGNORED_KEYS:
+            return None
         modifiers = []
         ctrl = bool(getattr(event, "ctrl", False))
         alt = bool(getattr(event, "alt", False) or getattr(event, "meta", False))
@@ -208,18 +224,16 @@ class VimEngineApp(App[None]):
             modifiers.append("CTRL")
         if alt:
             modifiers.append("ALT")
-        if shift and not (event.character and len(event.character) == 1):
+        character = event.character
+        if shift and not (character and len(character) == 1):
             modifiers.append("SHIFT")
-        key = event.key
-        if key in {"ctrl+c", "ctrl+q"}:
-            return None
-        if key == "escape":
-            return ("ESC", None, tuple(modifiers))
-        if key in {"enter", "return"}:
-            return ("ENTER", None, tuple(modifiers))
-        if event.character:
-            return (event.character, event.character, tuple(modifiers))
-        return (key.upper(), None, tuple(modifiers))
+        mods = tuple(modifiers)
+        special = cls._SPECIAL_KEYS.get(key)
+        if special is not None:
+            return (special, None, mods)
+        if character:
+            return (character, character, mods)
+        return (key.upper(), None, mods)
 
 
 def _env_int(key: str, fallback: int) -> int:
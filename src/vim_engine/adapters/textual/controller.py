@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Optional
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from vim_engine.buffer import BufferMirror
 from vim_engine.modes import KeyInput, ModeResult
@@ -14,6 +15,21 @@ def _noop(*_args, **_kwargs) -> None:  # pragma: no cover - default hook
     return None
 
 
+def _normalize_modifiers(modifiers: Iterable[str]) -> Tuple[str, ...]:
+    if not modifiers:
+        return ()
+    combo = modifiers if isinstance(modifiers, tuple) else tuple(modifiers)
+    return _upper_modifiers(combo)
+
+
+# Hosts send a handful of distinct modifier combinations; reuse their upper-cased
+# tuples rather than rebuilding one per keystroke. The bound keeps arbitrary host
+# input from growing the cache.
+@lru_cache(maxsize=64)
+def _upper_modifiers(combo: Tuple[object, ...]) -> Tuple[str, ...]:
+    return tuple(str(mod).upper() for mod in combo)
+
+
 @dataclass(slots=True)
 class TextualUIHooks:
     """Callbacks invoked by the adapter to update Textual widgets."""
@@ -29,9 +45,28 @@ class TextualUIHooks:
 class TextualVimAdapter:
     """Bridges ModeManager + bus events to a Textual-friendly surface."""
 
+    _EVENTS = (
+        "visual.selection",
+        "visual.yank",
+        "visual.delete",
+        "command.start",
+        "command.end",
+        "command.submit",
+        "command.write",
+        "command.quit",
+        "command.edit",
+        "command.echo",
+    )
+
     def __init__(self, manager: ModeManager, hooks: TextualUIHooks) -> None:
         self.manager = manager
         self.hooks = hooks
+        # Buffer refreshes requested while a key or timeout is being dispatched
+        # are coalesced into one push once dispatch finishes.
+        self._dispatching = False
+        self._refresh_pending = False
+        self._last_view: Optional[Tuple[object, ...]] = None
+        self._shown_command: Optional[str] = None
         self._subscribe_events()
         self._refresh_buffer()
         self._refresh_command_line()
@@ -45,17 +80,21 @@ class TextualVimAdapter:
     ) -> ModeResult:
         """Translate a Textual key event into a KeyInput and dispatch it."""
 
-        normalized_modifiers = tuple(str(mod).upper() for mod in modifiers)
+        normalized_modifiers = _normalize_modifiers(modifiers)
         self._log_state(
             "key ->",
             key=key,
             text=text,
             mods=normalized_modifiers,
         )
-        result = self.manager.handle_key(
-            KeyInput(key=key, text=text, modifiers=normalized_modifiers)
-        )
-        self._after_mode_result(result)
+        self._dispatching = True
+        try:
+            result = self.manager.handle_key(
+                KeyInput(key=key, text=text, modifiers=normalized_modifiers)
+            )
+            self._after_mode_result(result)
+        finally:
+            self._finish_dispatch()
         self._log_state(
             "result <-",
             consumed=result.consumed,
@@ -69,7 +108,11 @@ class TextualVimAdapter:
     def process_timeouts(self) -> Dict[str, ModeResult]:
         """Forward expired timers and surface results to the UI."""
 
-        results = self.manager.process_timeouts()
+        self._dispatching = True
+        try:
+            results = self.manager.process_timeouts()
+        finally:
+            self._finish_dispatch()
         for mode_name, outcome in results.items():
             label = f"{mode_name}:{outcome.status}"
             self.hooks.update_status(label)
@@ -91,21 +134,9 @@ class TextualVimAdapter:
 
     def _subscribe_events(self) -> None:
         bus = self.manager.context.bus
-        for event in (
-            "visual.selection",
-            "visual.yank",
-            "visual.delete",
-            "command.start",
-            "command.end",
-            "command.submit",
-            "command.write",
-            "command.quit",
-            "command.edit",
-            "command.echo",
-        ):
-            bus.subscribe(
-                event, lambda payload, name=event: self._handle_event(name, payload)
-            )
+        handle_event = self._handle_event
+        for event in self._EVENTS:
+            bus.subscribe(event, partial(handle_event, event))
 
     def _handle_event(self, name: str, payload: object | None) -> None:
         # Surface the event to the host UI and also emit a realtime log line.
@@ -119,26 +150,50 @@ class TextualVimAdapter:
             self._refresh_buffer()
 
     def _refresh_buffer(self) -> None:
-        mirror = self.manager.context.buffer.mirror()
-        self.hooks.update_buffer(mirror)
+        if self._dispatching:
+            self._refresh_pending = True
+            return
+        buffer = self.manager.context.buffer
+        state = buffer.state
+        document, cursor, selection = buffer.document, state.cursor, state.selection
+        last = self._last_view
+        # Documents are replaced on every edit, so identity is enough and avoids
+        # comparing their line lists.
+        if (
+            last is not None
+            and last[0] is document
+            and last[1] == cursor
+            and last[2] == selection
+        ):
+            return
+        self._last_view = (document, cursor, selection)
+        self.hooks.update_buffer(buffer.mirror())
+
+    def _finish_dispatch(self) -> None:
+        self._dispatching = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_buffer()
 
     def _refresh_command_line(self) -> None:
-        state = self.manager.context.extras.get("command_state")
-        if isinstance(state, dict):
-            text = str(state.get("text", ""))
-        else:
-            text = ""
+        text = self.manager.context.command_text
+        if text == self._shown_command:
+            return
+        self._shown_command = text
         self.hooks.show_command(text)
 
     def _log_state(self, prefix: str, **fields: object) -> None:
+        log = self.hooks.log
+        # Skip building the state snapshot when no host log hook is attached.
+        if log is _noop:
+            return
         try:
             snapshot = self._state_metadata()
-            snapshot.update({k: v for k, v in fields.items() if v is not None})
-            parts = [prefix]
-            for key, value in snapshot.items():
-                parts.append(f"{key}={value!r}")
-            line = " ".join(parts)
-            self.hooks.log(line)
+            for key, value in fields.items():
+                if value is not None:
+                    snapshot[key] = value
+            pairs = " ".join(f"{key}={value!r}" for key, value in snapshot.items())
+            log(f"{prefix} {pairs}")
         except Exception:
             pass
 
@@ -146,10 +201,7 @@ class TextualVimAdapter:
         buffer = self.manager.context.buffer
         active_mode = self.manager.active_mode
         mode = active_mode.name if active_mode else "?"
-        command_state = self.manager.context.extras.get("command_state")
-        command_text = ""
-        if isinstance(command_state, dict):
-            command_text = str(command_state.get("text", ""))
+        command_text = self.manager.context.command_text
         pending = bool(getattr(self.manager, "_pending_timeouts", None))
         return {
             "mode": mode,
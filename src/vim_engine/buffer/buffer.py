@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import ContextManager, Optional
 
 from vim_engine.runtime import telemetry
 
-from .document import BufferDocument
+from .document import BufferDocument, split_lines
 from .registers import RegisterBank
 from .state import BufferState, Cursor, Selection
 from .sync import BufferMirror
@@ -56,14 +57,14 @@ class Buffer:
     def snapshot(self) -> BufferView:
         return BufferView(
             version=self.document.version,
-            text=_flatten_lines(self.document.snapshot()),
+            text=self.document.text,
             cursor=self.state.cursor,
             selection=self.state.selection,
         )
 
     def mirror(self, *, attributes: Optional[dict[str, str]] = None) -> BufferMirror:
         return BufferMirror(
-            text=_flatten_lines(self.document.snapshot()),
+            text=self.document.text,
             cursor=self.state.cursor,
             selection=self.state.selection,
             attributes=dict(attributes or {}),
@@ -73,23 +74,28 @@ class Buffer:
         self, start: Cursor, end: Cursor, text: str, *, label: str
     ) -> BufferDelta:
         after_text = ""
-        start = ensure_cursor(self.document, start)
-        end = ensure_cursor(self.document, end)
+        document = self.document
+        start = ensure_cursor(document, start)
+        end = ensure_cursor(document, end)
         with Transaction(self, label) as tx:
-            before_text = _flatten_lines(self.document.snapshot())
-            start_offset = _offset_for_cursor(self.document, start)
-            end_offset = _offset_for_cursor(self.document, end)
-            new_text = before_text[:start_offset] + text + before_text[end_offset:]
-            self.document = BufferDocument.from_text(new_text)
-            self.state.set_cursor(
-                *_cursor_from_offset(self.document, start_offset + len(text))
+            removed = _text_between(document, start, end)
+            (start_row, start_col), (end_row, end_col) = start, end
+            pieces, row_offset, col = _splice_lines(
+                document.get_line(start_row)[:start_col],
+                text,
+                document.get_line(end_row)[end_col:],
             )
-            self.state.last_change_tick = self.document.version
-            after_text = new_text
-            tx.commit(before_text, after_text, start, self.state.cursor)
+            cursor = (start_row + row_offset, col)
+            document = self.document = document.update_lines(
+                start_row, end_row + 1, pieces
+            )
+            self.state.cursor = cursor
+            self.state.last_change_tick = document.version
+            after_text = document.text
+            tx.commit(start, removed, text, start, cursor)
 
         return BufferDelta(
-            version=self.document.version,
+            version=document.version,
             text=after_text,
             cursor=self.state.cursor,
             selection=self.state.selection,
@@ -104,14 +110,12 @@ class Buffer:
         return self.replace_range(start, end, "", label="delete_range")
 
     def get_text_range(self, start: Cursor, end: Cursor) -> str:
-        start = ensure_cursor(self.document, start)
-        end = ensure_cursor(self.document, end)
+        document = self.document
+        start = ensure_cursor(document, start)
+        end = ensure_cursor(document, end)
         if start > end:
             start, end = end, start
-        text = _flatten_lines(self.document.snapshot())
-        start_offset = _offset_for_cursor(self.document, start)
-        end_offset = _offset_for_cursor(self.document, end)
-        return text[start_offset:end_offset]
+        return _text_between(document, start, end)
 
 
 class Transaction(AbstractContextManager["Transaction"]):
@@ -124,7 +128,7 @@ class Transaction(AbstractContextManager["Transaction"]):
     def __enter__(self) -> "Transaction":
         self._before_cursor = self.buffer.state.cursor
         self._span_cm = telemetry.span(
-            name=f"buffer::{self.label}",
+            name=_span_name(self.label),
             component=True,
             metadata={"buffer": self.buffer.name},
         )
@@ -133,15 +137,17 @@ class Transaction(AbstractContextManager["Transaction"]):
 
     def commit(
         self,
-        before_text: str,
-        after_text: str,
+        start: Cursor,
+        removed: str,
+        inserted: str,
         cursor_before: Cursor,
         cursor_after: Cursor,
     ) -> None:
         entry = UndoEntry(
             label=self.label,
-            before_text=before_text,
-            after_text=after_text,
+            start=start,
+            removed=removed,
+            inserted=inserted,
             cursor_before=cursor_before,
             cursor_after=cursor_after,
         )
@@ -153,26 +159,42 @@ class Transaction(AbstractContextManager["Transaction"]):
         return False
 
 
+# Edit labels are mostly a small fixed set, so share one span name per label;
+# the bound keeps caller-supplied labels from growing the cache.
+@lru_cache(maxsize=128)
+def _span_name(label: str) -> str:
+    return f"buffer::{label}"
+
+
+def _splice_lines(prefix: str, text: str, suffix: str) -> tuple[list[str], int, int]:
+    """Split ``prefix + text + suffix`` into lines and locate the end of ``text``.
+
+    Lines are split with the same rule as ``BufferDocument.from_text`` so CR and
+    CRLF input become line breaks rather than characters inside a line.
+    """
+
+    head = prefix + text
+    pieces = split_lines(head + suffix)
+    head_lines = head.splitlines(keepends=True) or [""]
+    last = head_lines[-1]
+    row = len(head_lines) - 1
+    col = len(last)
+    if last and last.splitlines()[0] != last:
+        row, col = row + 1, 0
+    if row >= len(pieces):
+        row, col = len(pieces) - 1, len(pieces[-1])
+    return pieces, row, col
+
+
 def _flatten_lines(lines) -> str:
     return "\n".join(lines)
 
 
-def _offset_for_cursor(document: BufferDocument, cursor: Cursor) -> int:
-    lines = document.snapshot()
-    row, col = cursor
-    offset = 0
-    for i in range(row):
-        offset += len(lines[i]) + 1  # newline
-    offset += col
-    return offset
-
-
-def _cursor_from_offset(document: BufferDocument, offset: int) -> Cursor:
-    lines = document.snapshot()
-    running = 0
-    for row, line in enumerate(lines):
-        line_len = len(line)
-        if offset <= running + line_len:
-            return (row, offset - running)
-        running += line_len + 1
-    return (len(lines) - 1, len(lines[-1]))
+def _text_between(document: BufferDocument, start: Cursor, end: Cursor) -> str:
+    (start_row, start_col), (end_row, end_col) = start, end
+    if start_row == end_row:
+        return document.get_line(start_row)[start_col:end_col]
+    lines = document.get_lines(start_row, end_row + 1)
+    lines[0] = lines[0][start_col:]
+    lines[-1] = lines[-1][:end_col]
+    return _flatten_lines(lines)
@@ -3,7 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence
+
+
+def split_lines(text: str) -> List[str]:
+    """Split ``text`` into document lines; a trailing newline opens a new line."""
+
+    lines = text.splitlines()
+    if not lines:
+        lines = [""]
+    elif text.endswith("\n"):
+        lines.append("")
+    return lines
 
 
 @dataclass(slots=True)
@@ -18,15 +29,11 @@ class BufferDocument:
     _lines: List[str] = field(default_factory=lambda: [""])
     version: int = 0
     dirty: bool = False
+    _text_cache: Optional[str] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_text(cls, text: str) -> "BufferDocument":
-        lines = text.splitlines()
-        if not lines:
-            lines = [""]
-        elif text.endswith("\n"):
-            lines.append("")
-        return cls(_lines=list(lines), version=0, dirty=False)
+        return cls(_lines=split_lines(text), version=0, dirty=False)
 
     def snapshot(self) -> Sequence[str]:
         """Return the current lines without exposing internal mutability."""
@@ -52,9 +59,23 @@ class BufferDocument:
         updated = BufferDocument(_lines=lines, version=self.version + 1, dirty=True)
         return updated
 
+    @property
+    def text(self) -> str:
+        """Return the document joined with newlines, computed once per version."""
+
+        if self._text_cache is None:
+            self._text_cache = "\n".join(self._lines)
+        return self._text_cache
+
     @property
     def line_count(self) -> int:
         return len(self._lines)
 
     def get_line(self, index: int) -> str:
         return self._lines[index]
+
+    def get_lines(self, start: int, end: int) -> List[str]:
+        return self._lines[start:end]
+
+    def line_length(self, index: int) -> int:
+        return len(self._lines[index])
@@ -3,24 +3,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Mapping, Optional
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RegisterValue:
     text: str
     type: str = "character"  # could be character, line, block
 
 
+_EMPTY_REGISTER = RegisterValue(text="")
+
+
 class RegisterBank:
     """Tracks unnamed, named, numbered, and special registers."""
 
     def __init__(self) -> None:
         self._registers: Dict[str, RegisterValue] = {}
-        self._registers['"'] = RegisterValue(text="")
+        self._registers['"'] = _EMPTY_REGISTER
 
     def get(self, name: str) -> RegisterValue:
-        return self._registers.get(name, RegisterValue(text=""))
+        return self._registers.get(name, _EMPTY_REGISTER)
 
     def set(self, name: str, value: RegisterValue) -> None:
         self._registers[name] = value
@@ -33,12 +37,16 @@ class RegisterBank:
         self.set(name, combined)
 
     def serialize(self) -> Mapping[str, RegisterValue]:
+        """Return a read-only live view; use ``snapshot`` for a detached copy."""
+
+        return MappingProxyType(self._registers)
+
+    def snapshot(self) -> Dict[str, RegisterValue]:
         return dict(self._registers)
 
     def load(self, data: Mapping[str, RegisterValue]) -> None:
-        self._registers.update(
-            {k: RegisterValue(text=v.text, type=v.type) for k, v in data.items()}
-        )
+        # RegisterValue is frozen, so instances can be shared without copying.
+        self._registers.update(data)
 
     def yank_to(
         self, name: str, text: str, *, register_type: str = "character"
@@ -26,3 +26,9 @@ class BufferState:
 
     def set_selection(self, start: Cursor, end: Cursor) -> None:
         self.selection = (start, end)
+
+    def apply_selection(self, anchor: Cursor, cursor: Cursor) -> None:
+        """Move the cursor and span the selection from ``anchor`` in one step."""
+
+        self.cursor = cursor
+        self.selection = (anchor, cursor)
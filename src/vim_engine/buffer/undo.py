@@ -10,9 +10,16 @@ from .state import Cursor
 
 @dataclass(slots=True)
 class UndoEntry:
+    """One edit as a delta: ``removed`` at ``start`` was replaced by ``inserted``.
+
+    Undo puts ``removed`` back over the span ``inserted`` now occupies; redo
+    repeats the original replacement.
+    """
+
     label: str
-    before_text: str
-    after_text: str
+    start: Cursor
+    removed: str
+    inserted: str
     cursor_before: Cursor
     cursor_after: Cursor
 
@@ -26,7 +33,7 @@ class UndoTimeline:
 
     def push(self, entry: UndoEntry) -> None:
         if self._index < len(self._entries) - 1:
-            self._entries = self._entries[: self._index + 1]
+            del self._entries[self._index + 1 :]
         self._entries.append(entry)
         self._index = len(self._entries) - 1
 
@@ -11,7 +11,6 @@ def ensure_cursor(document: BufferDocument, cursor: Cursor) -> Cursor:
     row, col = cursor
     if row < 0 or row >= document.line_count:
         raise BufferValidationError("Row out of range", cursor=cursor)
-    line = document.get_line(row)
-    if col < 0 or col > len(line):
+    if col < 0 or col > document.line_length(row):
         raise BufferValidationError("Column out of range", cursor=cursor)
     return cursor
@@ -1,6 +1,14 @@
 """Declarative keymap registry and default bindings."""
 
-from .models import ActionRef, Binding, KeySequence, KeyStroke, WhenClause
+from .models import (
+    ActionRef,
+    Binding,
+    KeySequence,
+    KeyStroke,
+    WhenClause,
+    canonical_key,
+    canonical_token,
+)
 from .registry import KeymapConflictError, KeymapRegistry, RegistryStats
 from .resolver import KeymapResolver, ResolutionMatch, ResolutionResult
 from .defaults import load_default_keymaps
@@ -11,6 +19,8 @@ __all__ = [
     "KeySequence",
     "KeyStroke",
     "WhenClause",
+    "canonical_key",
+    "canonical_token",
     "KeymapRegistry",
     "KeymapConflictError",
     "RegistryStats",
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Sequence, TypeVar
 
 from vim_engine.actions import command as command_actions
 from vim_engine.actions import core as core_actions
@@ -12,6 +13,8 @@ from vim_engine.actions import visual as visual_actions
 from .models import ActionRef, Binding, KeySequence
 from .registry import KeymapRegistry
 
+_Item = TypeVar("_Item", ActionRef, Binding)
+
 DEFAULT_ACTIONS: tuple[ActionRef, ...] = (
     ActionRef(
         id="core.enter_insert",
@@ -80,135 +83,143 @@ DEFAULT_ACTIONS: tuple[ActionRef, ...] = (
     ),
 )
 
+_SEQUENCES: Dict[tuple[str, ...], KeySequence] = {}
+
+
+def _sequence(*keys: str) -> KeySequence:
+    # Several defaults share a key (ESC in three modes); build each sequence once.
+    sequence = _SEQUENCES.get(keys)
+    if sequence is None:
+        sequence = _SEQUENCES[keys] = KeySequence.from_strings(*keys)
+    return sequence
+
+
 DEFAULT_BINDINGS: tuple[Binding, ...] = (
     Binding(
         id="normal.enter_insert",
         mode="normal",
-        sequence=KeySequence.from_strings("i"),
+        sequence=_sequence("i"),
         action_id="core.enter_insert",
         description="Enter insert mode",
     ),
     Binding(
         id="normal.enter_visual",
         mode="normal",
-        sequence=KeySequence.from_strings("v"),
+        sequence=_sequence("v"),
         action_id="core.enter_visual",
         description="Enter visual mode",
     ),
     Binding(
         id="normal.enter_command",
         mode="normal",
-        sequence=KeySequence.from_strings(":"),
+        sequence=_sequence(":"),
         action_id="core.enter_command",
         description="Enter command-line mode",
     ),
     Binding(
         id="insert.exit_escape",
         mode="insert",
-        sequence=KeySequence.from_strings("ESC"),
-        action_id="core.exit_to_normal",
-        description="Leave insert mode",
-    ),
-    Binding(
-        id="insert.exit_escape_alt",
-        mode="insert",
-        sequence=KeySequence.from_strings("<Esc>"),
+        sequence=_sequence("ESC"),
         action_id="core.exit_to_normal",
         description="Leave insert mode",
     ),
     Binding(
         id="visual.exit_escape",
         mode="visual",
-        sequence=KeySequence.from_strings("ESC"),
-        action_id="core.exit_to_normal",
-        description="Leave visual mode",
-    ),
-    Binding(
-        id="visual.exit_escape_alt",
-        mode="visual",
-        sequence=KeySequence.from_strings("<Esc>"),
+        sequence=_sequence("ESC"),
         action_id="core.exit_to_normal",
         description="Leave visual mode",
     ),
     Binding(
         id="visual.extend_left",
         mode="visual",
-        sequence=KeySequence.from_strings("h"),
+        sequence=_sequence("h"),
         action_id="visual.extend_left",
         description="Extend selection left",
     ),
     Binding(
         id="visual.extend_right",
         mode="visual",
-        sequence=KeySequence.from_strings("l"),
+        sequence=_sequence("l"),
         action_id="visual.extend_right",
         description="Extend selection right",
     ),
     Binding(
         id="visual.extend_up",
         mode="visual",
-        sequence=KeySequence.from_strings("k"),
+        sequence=_sequence("k"),
         action_id="visual.extend_up",
         description="Extend selection up",
     ),
     Binding(
         id="visual.extend_down",
         mode="visual",
-        sequence=KeySequence.from_strings("j"),
+        sequence=_sequence("j"),
         action_id="visual.extend_down",
         description="Extend selection down",
     ),
     Binding(
         id="visual.yank_selection",
         mode="visual",
-        sequence=KeySequence.from_strings("y"),
+        sequence=_sequence("y"),
         action_id="visual.yank_selection",
         description="Yank the current selection",
     ),
     Binding(
         id="visual.swap_anchor",
         mode="visual",
-        sequence=KeySequence.from_strings("o"),
+        sequence=_sequence("o"),
         action_id="visual.swap_anchor",
         description="Swap selection anchor",
     ),
     Binding(
         id="visual.delete_selection",
         mode="visual",
-        sequence=KeySequence.from_strings("d"),
+        sequence=_sequence("d"),
         action_id="visual.delete_selection",
         description="Delete current selection",
     ),
     Binding(
         id="visual.change_selection",
         mode="visual",
-        sequence=KeySequence.from_strings("c"),
+        sequence=_sequence("c"),
         action_id="visual.change_selection",
         description="Change current selection",
     ),
     Binding(
         id="command.exit_escape",
         mode="command",
-        sequence=KeySequence.from_strings("ESC"),
+        sequence=_sequence("ESC"),
         action_id="core.exit_to_normal",
         description="Cancel command line",
     ),
     Binding(
         id="command.submit_enter",
         mode="command",
-        sequence=KeySequence.from_strings("ENTER"),
-        action_id="command.submit_line",
-        description="Submit the command line",
-    ),
-    Binding(
-        id="command.submit_return",
-        mode="command",
-        sequence=KeySequence.from_strings("RETURN"),
+        sequence=_sequence("ENTER"),
         action_id="command.submit_line",
         description="Submit the command line",
     ),
 )
 
+DEFAULT_ACTIONS_BY_ID: Mapping[str, ActionRef] = MappingProxyType(
+    {action.id: action for action in DEFAULT_ACTIONS}
+)
+DEFAULT_BINDINGS_BY_ID: Mapping[str, Binding] = MappingProxyType(
+    {binding.id: binding for binding in DEFAULT_BINDINGS}
+)
+
+# Deprecated ids of the old <Esc>/RETURN bindings. Those spellings now resolve
+# through the ESC/ENTER bindings, so including one selects that binding while
+# excluding one is a no-op.
+_DEPRECATED_BINDING_IDS: Mapping[str, str] = MappingProxyType(
+    {
+        "insert.exit_escape_alt": "insert.exit_escape",
+        "visual.exit_escape_alt": "visual.exit_escape",
+        "command.submit_return": "command.submit_enter",
+    }
+)
+
 
 def load_default_keymaps(
     registry: KeymapRegistry,
@@ -224,17 +235,17 @@ def load_default_keymaps(
 ) -> None:
     """Register built-in actions and bindings for every mode."""
 
-    allowed_actions = _build_filters(include_actions, exclude_actions)
-    allowed_bindings = _build_filters(include_bindings, exclude_bindings)
-
-    for action in DEFAULT_ACTIONS:
-        if not _selected(action.id, allowed_actions):
-            continue
+    for action in _select(
+        DEFAULT_ACTIONS, DEFAULT_ACTIONS_BY_ID, include_actions, exclude_actions
+    ):
         registry.register_action(action, replace=replace)
 
-    for binding in DEFAULT_BINDINGS:
-        if not _selected(binding.id, allowed_bindings):
-            continue
+    for binding in _select(
+        DEFAULT_BINDINGS,
+        DEFAULT_BINDINGS_BY_ID,
+        _included_binding_ids(include_bindings),
+        exclude_bindings,
+    ):
         registry.register_binding(
             _binding_with_timeout(binding, default_sequence_timeout_ms),
             replace=replace,
@@ -263,21 +274,35 @@ def _binding_with_timeout(
     return replace(binding, sequence=sequence)
 
 
-__all__ = ["load_default_keymaps", "DEFAULT_ACTIONS", "DEFAULT_BINDINGS"]
+__all__ = [
+    "load_default_keymaps",
+    "DEFAULT_ACTIONS",
+    "DEFAULT_ACTIONS_BY_ID",
+    "DEFAULT_BINDINGS",
+    "DEFAULT_BINDINGS_BY_ID",
+]
 
 
-def _build_filters(
-    include: Sequence[str] | None, exclude: Sequence[str] | None
-) -> tuple[set[str] | None, set[str]]:
-    include_set = set(include) if include else None
-    exclude_set = set(exclude or ())
-    return include_set, exclude_set
+def _select(
+    items: Sequence[_Item],
+    by_id: Mapping[str, _Item],
+    include: Sequence[str] | None,
+    exclude: Sequence[str] | None,
+) -> Iterable[_Item]:
+    excluded = set(exclude) if exclude else ()
+    if include:
+        # Walk only the requested ids instead of filtering every default.
+        return [
+            by_id[item_id]
+            for item_id in dict.fromkeys(include)
+            if item_id in by_id and item_id not in excluded
+        ]
+    if not excluded:
+        return items
+    return [item for item in items if item.id not in excluded]
 
 
-def _selected(item_id: str, filters: tuple[set[str] | None, set[str]]) -> bool:
-    include, exclude = filters
-    if include is not None and item_id not in include:
-        return False
-    if item_id in exclude:
-        return False
-    return True
+def _included_binding_ids(ids: Sequence[str] | None) -> Sequence[str] | None:
+    if not ids:
+        return ids
+    return [_DEPRECATED_BINDING_IDS.get(binding_id, binding_id) for binding_id in ids]
@@ -2,14 +2,40 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Callable, Iterable, Mapping, MutableMapping
+from typing import Callable, Iterable, Mapping
+
+
+_KEY_ALIASES: Mapping[str, str] = MappingProxyType({"<Esc>": "ESC", "RETURN": "ENTER"})
+_EMPTY_MAPPING: Mapping[str, object] = MappingProxyType({})
+
+
+def canonical_key(key: str) -> str:
+    """Fold host-specific spellings of the same key onto one name."""
+
+    return _KEY_ALIASES.get(key, key)
+
+
+def canonical_token(token: str) -> str:
+    """Fold the key part of a ``mod+key`` token onto its canonical name."""
+
+    alias = _KEY_ALIASES.get(token)
+    if alias is not None:
+        return alias
+    prefix, sep, key = token.rpartition("+")
+    alias = _KEY_ALIASES.get(key) if sep else None
+    if alias is None:
+        return token
+    return f"{prefix}+{alias}"
 
 
 def _normalize_modifiers(modifiers: Iterable[str]) -> tuple[str, ...]:
-    values = tuple(m.strip().lower() for m in modifiers if m.strip())
-    return tuple(sorted(dict.fromkeys(values)))
+    if not modifiers:
+        return ()
+    seen = {stripped.lower() for m in modifiers if (stripped := m.strip())}
+    return tuple(sorted(seen)) if seen else ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,18 +45,25 @@ class KeyStroke:
     key: str
     modifiers: tuple[str, ...] = ()
     text: str | None = None
+    _token: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.key:
             raise ValueError("key cannot be empty")
-        object.__setattr__(self, "modifiers", _normalize_modifiers(self.modifiers))
+        modifiers = _normalize_modifiers(self.modifiers)
+        object.__setattr__(self, "modifiers", modifiers)
+        # The key keeps its spelling; the token folds aliases so conflict
+        # checks and lookups treat <Esc> and ESC as the same key.
+        token = _join_token(canonical_key(self.key), modifiers)
+        object.__setattr__(self, "_token", token)
 
     @property
     def token(self) -> str:
-        if self.modifiers:
-            modifier = "+".join(self.modifiers)
-            return f"{modifier}+{self.key}"
-        return self.key
+        return self._token
+
+
+def _join_token(key: str, modifiers: tuple[str, ...]) -> str:
+    return f"{'+'.join(modifiers)}+{key}" if modifiers else key
 
 
 @dataclass(frozen=True, slots=True)
@@ -39,14 +72,29 @@ class KeySequence:
 
     strokes: tuple[KeyStroke, ...]
     timeout_ms: int = 1000
+    _tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _signature: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.strokes:
             raise ValueError("KeySequence requires at least one stroke")
+        tokens = tuple(stroke.token for stroke in self.strokes)
+        signature = " ".join(tokens)
+        object.__setattr__(self, "_tokens", tokens)
+        object.__setattr__(self, "_signature", signature)
+        object.__setattr__(self, "_hash", hash((signature, self.timeout_ms)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @property
     def tokens(self) -> tuple[str, ...]:
-        return tuple(stroke.token for stroke in self.strokes)
+        return self._tokens
+
+    @property
+    def signature(self) -> str:
+        return self._signature
 
     def prepend(self, *strokes: KeyStroke) -> "KeySequence":
         return KeySequence(tuple(strokes) + self.strokes, timeout_ms=self.timeout_ms)
@@ -94,14 +142,19 @@ class ActionRef:
     handler: Callable[..., object]
     telemetry_name: str | None = None
     description: str = ""
-    metadata: Mapping[str, object] = field(default_factory=dict)
+    metadata: Mapping[str, object] = _EMPTY_MAPPING
 
     def __post_init__(self) -> None:
         if not self.id:
             raise ValueError("ActionRef id cannot be empty")
         if not callable(self.handler):
             raise TypeError("handler must be callable")
-        object.__setattr__(self, "metadata", MappingProxyType(dict(self.metadata)))
+        if not self.metadata:
+            object.__setattr__(self, "metadata", _EMPTY_MAPPING)
+        else:
+            metadata = MappingProxyType(dict(self.metadata))
+            object.__setattr__(self, "metadata", metadata)
+        object.__setattr__(self, "description", sys.intern(self.description))
         if self.telemetry_name is None:
             object.__setattr__(self, "telemetry_name", self.id)
 
@@ -110,14 +163,8 @@ class ActionRef:
 
 
 def _normalize_tags(tags: Iterable[str]) -> tuple[str, ...]:
-    seen: MutableMapping[str, None] = {}
-    result: list[str] = []
-    for tag in tags:
-        cleaned = tag.strip()
-        if cleaned and cleaned not in seen:
-            seen[cleaned] = None
-            result.append(cleaned)
-    return tuple(result)
+    cleaned = [stripped for tag in tags if (stripped := tag.strip())]
+    return tuple(dict.fromkeys(cleaned))
 
 
 @dataclass(frozen=True, slots=True)
@@ -133,6 +180,9 @@ class Binding:
     tags: tuple[str, ...] = ()
     source: str | None = None
     priority: int = 0
+    _when_map: Mapping[str, bool] = field(init=False, repr=False, compare=False)
+    _checks: tuple[tuple[str, bool], ...] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.id:
@@ -142,25 +192,61 @@ class Binding:
         if not self.action_id:
             raise ValueError("binding action_id cannot be empty")
         object.__setattr__(self, "tags", _normalize_tags(self.tags))
+        object.__setattr__(self, "description", sys.intern(self.description))
         normalized_when = tuple(
             clause if isinstance(clause, WhenClause) else WhenClause.parse(str(clause))
             for clause in self.when
         )
         object.__setattr__(self, "when", normalized_when)
+        when_map: Mapping[str, bool] = _EMPTY_MAPPING  # type: ignore[assignment]
+        if normalized_when:
+            when_map = MappingProxyType(
+                {clause.flag: clause.expected for clause in normalized_when}
+            )
+        object.__setattr__(self, "_when_map", when_map)
+        object.__setattr__(
+            self,
+            "_checks",
+            tuple((clause.flag, clause.expected) for clause in normalized_when),
+        )
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.id,
+                    self.mode,
+                    self.sequence.signature,
+                    self.action_id,
+                    normalized_when,
+                )
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @property
     def when_map(self) -> Mapping[str, bool]:
-        return MappingProxyType({clause.flag: clause.expected for clause in self.when})
+        return self._when_map
 
     def allows(self, context: Mapping[str, bool]) -> bool:
-        return all(clause.evaluate(context) for clause in self.when)
+        # Flattened (flag, expected) pairs keep the dispatch loop free of
+        # per-clause method calls.
+        get = context.get
+        for flag, expected in self._checks:
+            if bool(get(flag, False)) is not expected:
+                return False
+        return True
 
     @property
     def key_signature(self) -> str:
-        return " ".join(self.sequence.tokens)
+        return self.sequence.signature
 
 
 __all__ = [
+    "canonical_key",
+    "canonical_token",
     "KeyStroke",
     "KeySequence",
     "WhenClause",
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Dict, Iterable, Iterator, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from vim_engine.runtime.telemetry import span
+from vim_engine.runtime.telemetry import SpanHandle, span
 
 from .models import ActionRef, Binding, KeySequence
 
@@ -38,8 +38,12 @@ class KeymapRegistry:
     def __init__(self, *, logger_name: str | None = None) -> None:
         self._actions: Dict[str, ActionRef] = {}
         self._bindings: Dict[str, Binding] = {}
-        self._mode_index: Dict[str, Dict[str, set[str]]] = {}
+        self._signature_index: Dict[Tuple[str, str], List[str]] = {}
+        # Insertion-ordered id "sets" keep per-mode iteration deterministic.
+        self._mode_bindings: Dict[str, Dict[str, None]] = {}
         self._logger_name = logger_name
+        # Registries built without a logger skip span bookkeeping entirely.
+        self._telemetry_enabled = bool(logger_name)
         self._revision = 0
 
     def revision(self) -> int:
@@ -58,107 +62,55 @@ class KeymapRegistry:
             raise KeyError(f"Binding '{binding_id}' is not registered") from exc
 
     def register_action(self, action: ActionRef, *, replace: bool = False) -> ActionRef:
+        if not self._telemetry_enabled:
+            return self._register_action(action, replace=replace)
         with span(
             "keymaps::register_action",
             logger_name=self._logger_name,
             component="keymaps",
             metadata={"action_id": action.id},
         ):
-            if not replace and action.id in self._actions:
-                raise ValueError(f"Action '{action.id}' already registered")
-            self._actions[action.id] = action
-            return action
+            return self._register_action(action, replace=replace)
 
     def register_binding(self, binding: Binding, *, replace: bool = False) -> Binding:
+        if not self._telemetry_enabled:
+            return self._register_binding(binding, replace=replace, handle=None)
         with span(
             "keymaps::register_binding",
             logger_name=self._logger_name,
             component="keymaps",
             metadata={"binding_id": binding.id, "mode": binding.mode},
         ) as handle:
-            if binding.action_id not in self._actions:
-                handle.add_metadata("missing_action", binding.action_id)
-                raise KeyError(
-                    f"Binding '{binding.id}' references unknown action '{binding.action_id}'"
-                )
-
-            conflicts = self.detect_conflicts(binding)
-            if conflicts and not replace:
-                handle.add_metadata(
-                    "conflicts", ",".join(conflict.id for conflict in conflicts)
-                )
-                raise KeymapConflictError(binding, conflicts)
-
-            if replace:
-                for conflict in conflicts:
-                    self._remove_binding(conflict)
-                    self._bindings.pop(conflict.id, None)
-                existing = self._bindings.get(binding.id)
-                if existing:
-                    self._remove_binding(existing)
-                    self._bindings.pop(existing.id, None)
-            elif binding.id in self._bindings:
-                raise ValueError(f"Binding id '{binding.id}' already registered")
-
-            self._bindings[binding.id] = binding
-            self._index_binding(binding)
-            self._touch_bindings()
-            return binding
+            return self._register_binding(binding, replace=replace, handle=handle)
 
     def unregister_binding(self, binding_id: str) -> Optional[Binding]:
+        if not self._telemetry_enabled:
+            return self._unregister_binding(binding_id)
         with span(
             "keymaps::unregister_binding",
             logger_name=self._logger_name,
             component="keymaps",
             metadata={"binding_id": binding_id},
         ):
-            binding = self._bindings.pop(binding_id, None)
-            if not binding:
-                return None
-            self._remove_binding(binding)
-            self._touch_bindings()
-            return binding
+            return self._unregister_binding(binding_id)
 
     def update_binding(self, binding_id: str, **changes: object) -> Binding:
+        if not self._telemetry_enabled:
+            return self._update_binding(binding_id, changes, handle=None)
         with span(
             "keymaps::update_binding",
             logger_name=self._logger_name,
             component="keymaps",
             metadata={"binding_id": binding_id},
         ) as handle:
-            if binding_id not in self._bindings:
-                handle.fail("missing_binding")
-                raise KeyError(f"Binding '{binding_id}' not found")
-
-            current = self._bindings[binding_id]
-            updated = replace(current, **changes)
-            if updated.action_id not in self._actions:
-                handle.add_metadata("missing_action", updated.action_id)
-                raise KeyError(
-                    f"Binding '{binding_id}' references unknown action '{updated.action_id}'"
-                )
-
-            self._remove_binding(current)
-            conflicts = self.detect_conflicts(updated)
-            if conflicts:
-                self._index_binding(current)
-                handle.add_metadata(
-                    "conflicts", ",".join(conflict.id for conflict in conflicts)
-                )
-                raise KeymapConflictError(updated, conflicts)
-
-            self._bindings[binding_id] = updated
-            self._index_binding(updated)
-            self._touch_bindings()
-            return updated
+            return self._update_binding(binding_id, changes, handle=handle)
 
     def iter_bindings(self, mode: Optional[str] = None) -> Iterator[Binding]:
         if mode is None:
             yield from self._bindings.values()
             return
-        for bucket in self._mode_index.get(mode, {}).values():
-            for binding_id in bucket:
-                yield self._bindings[binding_id]
+        for binding_id in self._mode_bindings.get(mode, ()):
+            yield self._bindings[binding_id]
 
     def override_sequence_timeouts(
         self,
@@ -191,7 +143,7 @@ class KeymapRegistry:
         return RegistryStats(
             action_count=len(self._actions),
             binding_count=len(self._bindings),
-            modes=tuple(sorted(self._mode_index)),
+            modes=tuple(sorted(self._mode_bindings)),
         )
 
     def detect_conflicts(
@@ -199,8 +151,8 @@ class KeymapRegistry:
     ) -> list[Binding]:
         ignored = set(ignore or ())
         conflicts: list[Binding] = []
-        for match_id in self._mode_index.get(binding.mode, {}).get(
-            binding.key_signature, set()
+        for match_id in self._signature_index.get(
+            (binding.mode, binding.key_signature), ()
         ):
             if match_id in ignored:
                 continue
@@ -209,23 +161,111 @@ class KeymapRegistry:
                 conflicts.append(existing)
         return conflicts
 
+    def _register_action(self, action: ActionRef, *, replace: bool) -> ActionRef:
+        if not replace and action.id in self._actions:
+            raise ValueError(f"Action '{action.id}' already registered")
+        self._actions[action.id] = action
+        return action
+
+    def _register_binding(
+        self, binding: Binding, *, replace: bool, handle: Optional[SpanHandle]
+    ) -> Binding:
+        if binding.action_id not in self._actions:
+            if handle:
+                handle.add_metadata("missing_action", binding.action_id)
+            raise KeyError(
+                f"Binding '{binding.id}' references unknown action '{binding.action_id}'"
+            )
+
+        conflicts = self.detect_conflicts(binding)
+        if conflicts and not replace:
+            if handle:
+                handle.add_metadata(
+                    "conflicts", ",".join(conflict.id for conflict in conflicts)
+                )
+            raise KeymapConflictError(binding, conflicts)
+
+        if replace:
+            for conflict in conflicts:
+                self._remove_binding(conflict)
+                self._bindings.pop(conflict.id, None)
+            existing = self._bindings.get(binding.id)
+            if existing:
+                self._remove_binding(existing)
+                self._bindings.pop(existing.id, None)
+        elif binding.id in self._bindings:
+            raise ValueError(f"Binding id '{binding.id}' already registered")
+
+        self._bindings[binding.id] = binding
+        self._index_binding(binding)
+        self._touch_bindings()
+        return binding
+
+    def _unregister_binding(self, binding_id: str) -> Optional[Binding]:
+        binding = self._bindings.pop(binding_id, None)
+        if not binding:
+            return None
+        self._remove_binding(binding)
+        self._touch_bindings()
+        return binding
+
+    def _update_binding(
+        self,
+        binding_id: str,
+        changes: Dict[str, object],
+        *,
+        handle: Optional[SpanHandle],
+    ) -> Binding:
+        if binding_id not in self._bindings:
+            if handle:
+                handle.fail("missing_binding")
+            raise KeyError(f"Binding '{binding_id}' not found")
+
+        current = self._bindings[binding_id]
+        updated = replace(current, **changes)
+        if updated.action_id not in self._actions:
+            if handle:
+                handle.add_metadata("missing_action", updated.action_id)
+            raise KeyError(
+                f"Binding '{binding_id}' references unknown action '{updated.action_id}'"
+            )
+
+        self._remove_binding(current)
+        conflicts = self.detect_conflicts(updated)
+        if conflicts:
+            self._index_binding(current)
+            if handle:
+                handle.add_metadata(
+                    "conflicts", ",".join(conflict.id for conflict in conflicts)
+                )
+            raise KeymapConflictError(updated, conflicts)
+
+        self._bindings[binding_id] = updated
+        self._index_binding(updated)
+        self._touch_bindings()
+        return updated
+
     def _index_binding(self, binding: Binding) -> None:
-        by_signature = self._mode_index.setdefault(binding.mode, {})
-        bucket = by_signature.setdefault(binding.key_signature, set())
-        bucket.add(binding.id)
+        key = (binding.mode, binding.key_signature)
+        bucket = self._signature_index.get(key)
+        if bucket is None:
+            self._signature_index[key] = [binding.id]
+        elif binding.id not in bucket:
+            bucket.append(binding.id)
+        self._mode_bindings.setdefault(binding.mode, {})[binding.id] = None
 
     def _remove_binding(self, binding: Binding) -> None:
-        mode_bucket = self._mode_index.get(binding.mode)
-        if not mode_bucket:
-            return
-        signatures = mode_bucket.get(binding.key_signature)
-        if not signatures:
+        key = (binding.mode, binding.key_signature)
+        bucket = self._signature_index.get(key)
+        if not bucket or binding.id not in bucket:
             return
-        signatures.discard(binding.id)
-        if not signatures:
-            mode_bucket.pop(binding.key_signature, None)
+        bucket.remove(binding.id)
+        if not bucket:
+            del self._signature_index[key]
+        mode_bucket = self._mode_bindings[binding.mode]
+        mode_bucket.pop(binding.id, None)
         if not mode_bucket:
-            self._mode_index.pop(binding.mode, None)
+            del self._mode_bindings[binding.mode]
 
     def _touch_bindings(self) -> None:
         self._revision += 1
@@ -237,17 +277,18 @@ class KeymapRegistry:
 
 
 def _contexts_overlap(left: Binding, right: Binding) -> bool:
-    left_map = left.when_map
-    right_map = right.when_map
-
     if not left.when and not right.when:
         return True
 
-    for flag, expected in left_map.items():
-        if flag in right_map and right_map[flag] != expected:
-            return False
-    for flag, expected in right_map.items():
-        if flag in left_map and left_map[flag] != expected:
+    left_map = left.when_map
+    right_map = right.when_map
+    if len(left_map) > len(right_map):
+        smaller, larger = right_map, left_map
+    else:
+        smaller, larger = left_map, right_map
+    for flag, expected in smaller.items():
+        other = larger.get(flag)
+        if other is not None and other != expected:
             return False
 
     if not left.when or not right.when:
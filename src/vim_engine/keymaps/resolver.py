@@ -7,10 +7,14 @@ from typing import Dict, Literal, Mapping, Optional, Sequence
 
 from vim_engine.runtime.telemetry import span
 
-from .models import ActionRef, Binding
+from .models import ActionRef, Binding, canonical_token
 from .registry import KeymapRegistry
 
 
+def _binding_rank(binding: Binding) -> tuple[int, str]:
+    return (-binding.priority, binding.id)
+
+
 @dataclass(slots=True)
 class TrieNode:
     """Single trie node tracking bindings and child transitions."""
@@ -27,17 +31,40 @@ class TrieNode:
 
 @dataclass(slots=True)
 class KeymapTrie:
-    """Concrete trie built for a given mode."""
+    """Concrete trie built for a given mode.
+
+    ``prefixes`` flattens every reachable token prefix to its node so a
+    full sequence resolves with one dict lookup instead of a walk.
+    """
 
     mode: str
     root: TrieNode = field(default_factory=TrieNode)
+    prefixes: Dict[tuple[str, ...], TrieNode] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.prefixes[()] = self.root
 
     def add_binding(self, binding: Binding) -> None:
         node = self.root
-        for token in binding.sequence.tokens:
+        tokens = binding.sequence.tokens
+        for depth, token in enumerate(tokens, start=1):
             node = node.child(token)
+            self.prefixes[tokens[:depth]] = node
         node.bindings.append(binding.id)
 
+    def matched_depth(self, tokens: Sequence[str]) -> int:
+        """Return how many leading tokens follow an existing trie path."""
+
+        node = self.root
+        depth = 0
+        for token in tokens:
+            child = node.children.get(token)
+            if child is None:
+                break
+            node = child
+            depth += 1
+        return depth
+
 
 @dataclass(frozen=True, slots=True)
 class ResolutionMatch:
@@ -76,7 +103,7 @@ class KeymapResolver:
         context: Optional[Mapping[str, bool]] = None,
     ) -> ResolutionResult:
         ctx = context or {}
-        normalized = tuple(tokens)
+        normalized = tuple(map(canonical_token, tokens))
         with span(
             "keymaps::resolve",
             logger_name=self._logger_name,
@@ -84,15 +111,13 @@ class KeymapResolver:
             metadata={"mode": mode, "length": len(normalized)},
         ) as handle:
             trie = self._ensure_trie(mode)
-            node = trie.root
-            consumed = 0
-            for token in normalized:
-                child = node.children.get(token)
-                if child is None:
-                    handle.add_metadata("status", "miss")
-                    return ResolutionResult(status="miss", consumed=consumed)
-                node = child
-                consumed += 1
+            node = trie.prefixes.get(normalized)
+            if node is None:
+                handle.add_metadata("status", "miss")
+                return ResolutionResult(
+                    status="miss", consumed=trie.matched_depth(normalized)
+                )
+            consumed = len(normalized)
 
             match = self._select_match(node, ctx)
             if match:
@@ -144,32 +169,32 @@ class KeymapResolver:
         if not node.bindings:
             return None
 
-        matches: list[ResolutionMatch] = []
-        for binding_id in node.bindings:
-            binding = self._registry.get_binding(binding_id)
-            if not binding.allows(context):
-                continue
-            action = self._registry.get_action(binding.action_id)
-            matches.append(ResolutionMatch(binding=binding, action=action))
-
-        if not matches:
+        get_binding = self._registry.get_binding
+        allowed = [
+            binding
+            for binding in map(get_binding, node.bindings)
+            if binding.allows(context)
+        ]
+        if not allowed:
             return None
 
-        matches.sort(key=lambda m: (-m.binding.priority, m.binding.id))
-        return matches[0]
+        binding = min(allowed, key=_binding_rank)
+        return ResolutionMatch(
+            binding=binding, action=self._registry.get_action(binding.action_id)
+        )
 
     def _pending_timeout(self, node: TrieNode) -> Optional[int]:
-        timeouts: list[int] = []
+        get_binding = self._registry.get_binding
+        shortest: Optional[int] = None
         stack = list(node.children.values())
         while stack:
             current = stack.pop()
             for binding_id in current.bindings:
-                binding = self._registry.get_binding(binding_id)
-                timeouts.append(binding.sequence.timeout_ms)
+                timeout_ms = get_binding(binding_id).sequence.timeout_ms
+                if shortest is None or timeout_ms < shortest:
+                    shortest = timeout_ms
             stack.extend(current.children.values())
-        if not timeouts:
-            return None
-        return min(timeouts)
+        return shortest
 
 
 __all__ = [
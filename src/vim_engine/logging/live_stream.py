@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
 from contextlib import suppress
-from datetime import datetime
 from typing import Deque, Set
 
+# Upper bound on queued lines folded into a single write, to keep latency low.
+_MAX_BATCH = 64
+
 
 class NetworkLogStreamer:
     """Broadcast log lines to TCP clients (e.g., via ``nc``)."""
@@ -22,12 +25,15 @@ class NetworkLogStreamer:
     ) -> None:
         self.host = host
         self.port = port
-        self._history: Deque[str] = deque(maxlen=history)
+        self._history: Deque[bytes] = deque(maxlen=history)
         self._queue_size = queue_size
-        self._queue: asyncio.Queue[str] | None = None
+        self._queue: asyncio.Queue[bytes] | None = None
         self._server: asyncio.AbstractServer | None = None
         self._pump_task: asyncio.Task[None] | None = None
         self._clients: Set[asyncio.StreamWriter] = set()
+        # "HH:MM:SS" is re-rendered only when the wall-clock second changes.
+        self._stamp_second = -1
+        self._stamp_prefix = ""
 
     async def start(self) -> None:
         """Start listening for TCP clients."""
@@ -61,8 +67,12 @@ class NetworkLogStreamer:
     def log(self, line: str) -> None:
         """Queue a line to broadcast to all connected clients."""
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        entry = f"{timestamp} | {line}\n"
+        second, nanos = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp_prefix = time.strftime("%H:%M:%S", time.localtime(second))
+        millis = nanos // 1_000_000
+        entry = f"{self._stamp_prefix}.{millis:03d} | {line}\n".encode("utf-8")
         self._history.append(entry)
         if self._queue is None:
             return
@@ -73,18 +83,37 @@ class NetworkLogStreamer:
 
     async def _pump(self) -> None:
         assert self._queue is not None
+        queue = self._queue
         while True:
-            entry = await self._queue.get()
-            await self._broadcast(entry)
+            batch = [await queue.get()]
+            while len(batch) < _MAX_BATCH:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self._broadcast(b"".join(batch))
 
-    async def _broadcast(self, entry: str) -> None:
+    async def _broadcast(self, entry: bytes) -> None:
         dead: list[asyncio.StreamWriter] = []
-        for writer in self._clients.copy():
+        live: list[asyncio.StreamWriter] = []
+        # No await happens inside this loop, so the live set is safe to iterate.
+        for writer in self._clients:
             try:
-                writer.write(entry.encode("utf-8"))
-                await writer.drain()
+                writer.write(entry)
             except Exception:
                 dead.append(writer)
+            else:
+                live.append(writer)
+        if live:
+            # Drain concurrently so one slow client does not hold up the rest.
+            outcomes = await asyncio.gather(
+                *(writer.drain() for writer in live), return_exceptions=True
+            )
+            dead.extend(
+                writer
+                for writer, outcome in zip(live, outcomes)
+                if isinstance(outcome, Exception)
+            )
         for writer in dead:
             await self._close_writer(writer)
 
@@ -93,8 +122,7 @@ class NetworkLogStreamer:
     ) -> None:
         self._clients.add(writer)
         try:
-            for entry in self._history:
-                writer.write(entry.encode("utf-8"))
+            writer.write(b"".join(self._history))
             await writer.drain()
             while True:
                 chunk = await reader.read(1024)
@@ -104,8 +132,7 @@ class NetworkLogStreamer:
             await self._close_writer(writer)
 
     async def _close_writer(self, writer: asyncio.StreamWriter) -> None:
-        if writer in self._clients:
-            self._clients.remove(writer)
+        self._clients.discard(writer)
         writer.close()
         with suppress(Exception):
             await writer.wait_closed()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from vim_engine.buffer import Buffer, RegisterBank
+from vim_engine.buffer.state import Cursor
 
 
 @dataclass(slots=True)
@@ -36,6 +37,10 @@ class ModeContext:
     registers: RegisterBank
     bus: "ModeBus"
     extras: Dict[str, object] = field(default_factory=dict)
+    command_text: str = ""
+    # Created on the first submitted command line.
+    command_history: Optional[List[str]] = None
+    visual_anchor: Optional[Cursor] = None
 
 
 class ModeBus:
@@ -47,6 +52,9 @@ class ModeBus:
     def subscribe(self, event: str, callback: Callable[[object], None]) -> None:
         self._subscribers.setdefault(event, []).append(callback)
 
+    def has_subscribers(self, event: str) -> bool:
+        return bool(self._subscribers.get(event))
+
     def emit(self, event: str, payload: object | None = None) -> None:
         for callback in self._subscribers.get(event, []):
             callback(payload)
@@ -56,6 +64,7 @@ class Mode:
     """Base class all concrete editor modes inherit from."""
 
     name: str = "mode"
+    __slots__ = ("context",)
 
     def __init__(self, context: ModeContext) -> None:
         self.context = context
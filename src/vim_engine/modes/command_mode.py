@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, MutableMapping, cast
+from typing import Callable, Dict, List, Optional
 
 from vim_engine.runtime import telemetry
 
@@ -19,6 +19,16 @@ from .keymap_helpers import (
 
 class CommandMode(Mode):
     name = "command"
+    __slots__ = (
+        "logger",
+        "_resolver",
+        "_resolve",
+        "_flags",
+        "_pending",
+        "_default_timeout_ms",
+        "_typed",
+        "_edit_keys",
+    )
 
     def __init__(
         self,
@@ -29,10 +39,18 @@ class CommandMode(Mode):
         super().__init__(context)
         self.logger = telemetry.get_logger("vim_engine.modes.command")
         self._resolver = require_keymap_resolver(context)
+        self._resolve = self._resolver.resolve
         self._flags = keymap_flag_context(context)
         self._pending: List[str] = []
         self._typed: List[str] = []
         self._default_timeout_ms = default_pending_timeout_ms
+        self._edit_keys: Dict[str, Callable[[], Optional[ModeResult]]] = {
+            "ESC": self._cancel_line,
+            "<Esc>": self._cancel_line,
+            "ENTER": self._submit_line,
+            "RETURN": self._submit_line,
+            "BACKSPACE": self._delete_last_char,
+        }
 
     def on_enter(self, previous: str | None) -> None:
         del previous
@@ -55,16 +73,16 @@ class CommandMode(Mode):
 
     def handle_key(self, key: KeyInput) -> ModeResult:
         token = key_to_token(key)
-        self._pending.append(token)
-        result = self._resolver.resolve(
-            self.name, tuple(self._pending), context=self._flags
-        )
+        pending = self._pending
+        tokens = (*pending, token) if pending else (token,)
+        result = self._resolve(self.name, tokens, context=self._flags)
 
         if result.status == "match" and result.match:
             self._pending.clear()
             return self._execute_match(result.match)
 
         if result.status == "pending":
+            pending.append(token)
             timeout_ms = result.timeout_ms or self._default_timeout_ms
             return ModeResult(
                 consumed=True,
@@ -77,29 +95,11 @@ class CommandMode(Mode):
         return self._handle_text_input(key)
 
     def _handle_text_input(self, key: KeyInput) -> ModeResult:
-        if key.key in {"ESC", "<Esc>"}:
-            self._typed.clear()
-            self._sync_command_state()
-            return ModeResult(
-                consumed=True, switch_to="normal", message="command_cancel"
-            )
-
-        if key.key in {"ENTER", "RETURN"}:
-            command = self.current_command
-            self.context.bus.emit("command.submit", command)
-            self._typed.clear()
-            self._sync_command_state()
-            return ModeResult(
-                consumed=True,
-                switch_to="normal",
-                status="command_submit",
-                message=command,
-            )
-
-        if key.key == "BACKSPACE" and self._typed:
-            self._typed.pop()
-            self._sync_command_state()
-            return ModeResult(consumed=True, status="editing")
+        edit = self._edit_keys.get(key.key)
+        if edit is not None:
+            result = edit()
+            if result is not None:
+                return result
 
         if key.text:
             self._typed.append(key.text)
@@ -108,13 +108,37 @@ class CommandMode(Mode):
 
         return ModeResult(consumed=False, status="miss", message="unhandled")
 
+    def _cancel_line(self) -> ModeResult:
+        self._typed.clear()
+        self._sync_command_state()
+        return ModeResult(consumed=True, switch_to="normal", message="command_cancel")
+
+    def _submit_line(self) -> ModeResult:
+        command = self.current_command
+        self.context.bus.emit("command.submit", command)
+        self._typed.clear()
+        self._sync_command_state()
+        return ModeResult(
+            consumed=True,
+            switch_to="normal",
+            status="command_submit",
+            message=command,
+        )
+
+    def _delete_last_char(self) -> Optional[ModeResult]:
+        if not self._typed:
+            return None
+        self._typed.pop()
+        self._sync_command_state()
+        return ModeResult(consumed=True, status="editing")
+
     def handle_timeout(self) -> ModeResult:
         if not self._pending:
             return ModeResult(consumed=False, status="timeout")
 
         tokens = tuple(self._pending)
         self._pending.clear()
-        result = self._resolver.resolve(self.name, tokens, context=self._flags)
+        result = self._resolve(self.name, tokens, context=self._flags)
         if result.status == "match" and result.match:
             return self._execute_match(result.match)
         return ModeResult(consumed=False, status="timeout", message="pending_timeout")
@@ -125,18 +149,11 @@ class CommandMode(Mode):
             component="keymaps",
             metadata={"binding_id": match.binding.id, "action": match.action.id},
         ):
-            outcome = match.action(self.context, match)
+            outcome = match.action.handler(self.context, match)
 
         if isinstance(outcome, ModeResult):
             return outcome
         return ModeResult(consumed=True)
 
-    def _command_state(self) -> MutableMapping[str, object]:
-        return cast(
-            MutableMapping[str, object],
-            self.context.extras.setdefault("command_state", {}),
-        )
-
     def _sync_command_state(self) -> None:
-        state = self._command_state()
-        state["text"] = self.current_command
+        self.context.command_text = self.current_command
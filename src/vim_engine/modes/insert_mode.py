@@ -14,6 +14,14 @@ from .keymap_helpers import key_to_token, keymap_flag_context, require_keymap_re
 
 class InsertMode(Mode):
     name = "insert"
+    __slots__ = (
+        "logger",
+        "_resolver",
+        "_resolve",
+        "_flags",
+        "_pending",
+        "_default_timeout_ms",
+    )
 
     def __init__(
         self,
@@ -24,6 +32,7 @@ class InsertMode(Mode):
         super().__init__(context)
         self.logger = telemetry.get_logger("vim_engine.modes.insert")
         self._resolver = require_keymap_resolver(context)
+        self._resolve = self._resolver.resolve
         self._flags = keymap_flag_context(context)
         self._pending: List[str] = []
         self._default_timeout_ms = default_pending_timeout_ms
@@ -34,16 +43,16 @@ class InsertMode(Mode):
 
     def handle_key(self, key: KeyInput) -> ModeResult:
         token = key_to_token(key)
-        self._pending.append(token)
-        result = self._resolver.resolve(
-            self.name, tuple(self._pending), context=self._flags
-        )
+        pending = self._pending
+        tokens = (*pending, token) if pending else (token,)
+        result = self._resolve(self.name, tokens, context=self._flags)
 
         if result.status == "match" and result.match:
             self._pending.clear()
             return self._execute_match(result.match)
 
         if result.status == "pending":
+            pending.append(token)
             timeout_ms = result.timeout_ms or self._default_timeout_ms
             return ModeResult(
                 consumed=True,
@@ -66,7 +75,7 @@ class InsertMode(Mode):
             component="keymaps",
             metadata={"binding_id": match.binding.id, "action": match.action.id},
         ):
-            outcome = match.action(self.context, match)
+            outcome = match.action.handler(self.context, match)
 
         if isinstance(outcome, ModeResult):
             return outcome
@@ -78,7 +87,7 @@ class InsertMode(Mode):
 
         tokens = tuple(self._pending)
         self._pending.clear()
-        result = self._resolver.resolve(self.name, tokens, context=self._flags)
+        result = self._resolve(self.name, tokens, context=self._flags)
         if result.status == "match" and result.match:
             return self._execute_match(result.match)
         return ModeResult(consumed=False, status="timeout", message="pending_timeout")
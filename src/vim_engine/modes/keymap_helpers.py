@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from typing import Mapping, MutableMapping, cast
 
-from vim_engine.keymaps import KeymapResolver
+from vim_engine.keymaps import KeymapResolver, canonical_key
 
 from .base_mode import KeyInput, ModeContext
 
 
 def key_to_token(key: KeyInput) -> str:
+    name = canonical_key(key.key)
     if key.modifiers:
         modifier = "+".join(key.modifiers)
-        return f"{modifier}+{key.key}"
-    return key.key
+        return f"{modifier}+{name}"
+    return name
 
 
 def require_keymap_resolver(context: ModeContext) -> KeymapResolver:
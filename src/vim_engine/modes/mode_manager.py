@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import time
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 
 from vim_engine.runtime import telemetry
 
@@ -13,7 +13,7 @@ from vim_engine.keymaps import KeymapRegistry, KeymapResolver, load_default_keym
 from .base_mode import KeyInput, Mode, ModeContext, ModeResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PendingTimeout:
     deadline: float
     timeout_ms: int
@@ -33,7 +33,8 @@ class ModeManager:
     ) -> None:
         self.context = context
         self._modes: Dict[str, Mode] = {}
-        self._active: Optional[str] = None
+        self._span_names: Dict[str, Tuple[str, str]] = {}
+        self._active_mode: Optional[Mode] = None
         self.logger = telemetry.get_logger("vim_engine.modes")
         self.keymap_registry = keymap_registry or KeymapRegistry(
             logger_name="vim_engine.keymaps"
@@ -52,9 +53,7 @@ class ModeManager:
 
     @property
     def active_mode(self) -> Optional[Mode]:
-        if self._active is None:
-            return None
-        return self._modes.get(self._active)
+        return self._active_mode
 
     def register_mode(
         self,
@@ -67,31 +66,36 @@ class ModeManager:
         if mode.name in self._modes:
             raise ValueError(f"Mode '{mode.name}' already registered")
         self._modes[mode.name] = mode
-        if self._active is None:
-            self._active = mode.name
+        self._span_names[mode.name] = (
+            f"mode::{mode.name}",
+            f"mode_timeout::{mode.name}",
+        )
+        if self._active_mode is None:
+            self._active_mode = mode
             mode.on_enter(None)
         return mode
 
     def switch_mode(self, name: str) -> None:
-        if name not in self._modes:
+        target = self._modes.get(name)
+        if target is None:
             raise KeyError(f"Unknown mode '{name}'")
-        previous = self.active_mode
-        if previous and previous.name == name:
+        previous = self._active_mode
+        if previous is target:
             return
         if previous:
             self.cancel_timeout(previous.name)
             previous.on_exit(name)
-        self._active = name
-        self._modes[name].on_enter(previous.name if previous else None)
+        self._active_mode = target
+        target.on_enter(previous.name if previous else None)
         self.cancel_timeout(name)
         telemetry.record_event("mode.switch", data={"mode": name})
 
     def handle_key(self, key: KeyInput) -> ModeResult:
-        mode = self.active_mode
+        mode = self._active_mode
         if mode is None:
             raise RuntimeError("No active mode registered")
         with telemetry.span(
-            name=f"mode::{mode.name}",
+            name=self._span_names[mode.name][0],
             component=True,
             metadata={"key": key.key, "mode": mode.name},
         ):
@@ -101,7 +105,7 @@ class ModeManager:
     def _after_mode_result(self, mode: Mode, result: ModeResult) -> ModeResult:
         if result.timeout_ms:
             self.arm_timeout(mode.name, result.timeout_ms)
-        else:
+        elif self._pending_timeouts:
             self.cancel_timeout(mode.name)
         if result.switch_to:
             self.switch_mode(result.switch_to)
@@ -120,15 +124,13 @@ class ModeManager:
         self._pending_timeouts.pop(mode_name, None)
 
     def process_timeouts(self) -> Dict[str, ModeResult]:
-        now = time.monotonic()
-        expired = {
-            mode_name: timer
-            for mode_name, timer in self._pending_timeouts.items()
-            if timer.deadline <= now
-        }
         results: Dict[str, ModeResult] = {}
-        for mode_name, timer in expired.items():
-            results[mode_name] = self._trigger_timeout(mode_name, timer.generation)
+        if not self._pending_timeouts:
+            return results
+        now = time.monotonic()
+        for mode_name, timer in list(self._pending_timeouts.items()):
+            if timer.deadline <= now:
+                results[mode_name] = self._trigger_timeout(mode_name, timer.generation)
         return results
 
     def force_timeout(self, mode_name: Optional[str] = None) -> Dict[str, ModeResult]:
@@ -154,7 +156,7 @@ class ModeManager:
         if mode is None:
             return ModeResult(consumed=False, status="timeout")
         with telemetry.span(
-            name=f"mode_timeout::{mode_name}",
+            name=self._span_names[mode_name][1],
             component=True,
             metadata={"mode": mode_name},
         ):
@@ -37,21 +37,27 @@ class OperatorDraft:
 
 
 class CountParser:
+    __slots__ = ()
+
     def parse(self, keys: Sequence[str], draft: OperatorDraft) -> Sequence[str]:
-        digits = []
+        if not keys or not keys[0].isdigit():
+            return keys
+        count_len = 0
         for key in keys:
-            if key.isdigit():
-                digits.append(key)
-                draft.raw_keys.append(key)
-            else:
+            if not key.isdigit():
                 break
-        if digits:
-            draft.count = int("".join(digits))
-            return keys[len(digits) :]
-        return keys
+            count_len += 1
+        if not count_len:
+            return keys
+        digits = keys[:count_len]
+        draft.raw_keys.extend(digits)
+        draft.count = int("".join(digits))
+        return keys[count_len:]
 
 
 class MotionParser:
+    __slots__ = ()
+
     def parse(self, keys: Sequence[str], draft: OperatorDraft) -> Sequence[str]:
         if not keys:
             return keys
@@ -62,6 +68,8 @@ class MotionParser:
 
 
 class OperatorResolver:
+    __slots__ = ()
+
     def resolve(
         self, keys: Sequence[str], draft: OperatorDraft
     ) -> Optional[ExecutionPlan]:
@@ -81,6 +89,14 @@ class OperatorResolver:
 
 
 class OperatorPipeline:
+    __slots__ = (
+        "buffer",
+        "registers",
+        "count_parser",
+        "motion_parser",
+        "resolver",
+    )
+
     def __init__(
         self, *, buffer: Buffer, registers: Optional[RegisterBank] = None
     ) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, MutableMapping, cast
+from typing import List
 
 from vim_engine.runtime import telemetry
 
@@ -20,6 +20,16 @@ from .operator_pipeline import OperatorPipeline
 
 class VisualMode(Mode):
     name = "visual"
+    __slots__ = (
+        "logger",
+        "_resolver",
+        "_resolve",
+        "_flags",
+        "_pending",
+        "_default_timeout_ms",
+        "_operator_pipeline",
+        "_operator_tokens",
+    )
 
     def __init__(
         self,
@@ -30,6 +40,7 @@ class VisualMode(Mode):
         super().__init__(context)
         self.logger = telemetry.get_logger("vim_engine.modes.visual")
         self._resolver = require_keymap_resolver(context)
+        self._resolve = self._resolver.resolve
         self._flags = keymap_flag_context(context)
         self._pending: List[str] = []
         self._default_timeout_ms = default_pending_timeout_ms
@@ -44,8 +55,7 @@ class VisualMode(Mode):
         self._pending.clear()
         self._operator_tokens.clear()
         anchor = self.context.buffer.state.cursor
-        state = self._visual_state()
-        state["anchor"] = anchor
+        self.context.visual_anchor = anchor
         self.context.buffer.state.set_selection(anchor, anchor)
 
     def on_exit(self, next_mode: str | None) -> None:
@@ -53,17 +63,14 @@ class VisualMode(Mode):
         update_flag(self.context, "visual_active", False)
         self._pending.clear()
         self._operator_tokens.clear()
-        visual_state = self.context.extras.get("visual_state")
-        if isinstance(visual_state, dict):
-            visual_state.pop("anchor", None)
+        self.context.visual_anchor = None
         self.context.buffer.state.clear_selection()
 
     def handle_key(self, key: KeyInput) -> ModeResult:
         token = key_to_token(key)
-        self._pending.append(token)
-        result = self._resolver.resolve(
-            self.name, tuple(self._pending), context=self._flags
-        )
+        pending = self._pending
+        tokens = (*pending, token) if pending else (token,)
+        result = self._resolve(self.name, tokens, context=self._flags)
 
         if result.status == "match" and result.match:
             self._pending.clear()
@@ -71,6 +78,7 @@ class VisualMode(Mode):
             return self._execute_match(result.match)
 
         if result.status == "pending":
+            pending.append(token)
             timeout_ms = result.timeout_ms or self._default_timeout_ms
             return ModeResult(
                 consumed=True,
@@ -107,7 +115,7 @@ class VisualMode(Mode):
             tokens = tuple(self._pending)
             self._pending.clear()
             self._operator_tokens.clear()
-            result = self._resolver.resolve(self.name, tokens, context=self._flags)
+            result = self._resolve(self.name, tokens, context=self._flags)
             if result.status == "match" and result.match:
                 return self._execute_match(result.match)
             return ModeResult(
@@ -128,14 +136,8 @@ class VisualMode(Mode):
             component="keymaps",
             metadata={"binding_id": match.binding.id, "action": match.action.id},
         ):
-            outcome = match.action(self.context, match)
+            outcome = match.action.handler(self.context, match)
 
         if isinstance(outcome, ModeResult):
             return outcome
         return ModeResult(consumed=True)
-
-    def _visual_state(self) -> MutableMapping[str, object]:
-        return cast(
-            MutableMapping[str, object],
-            self.context.extras.setdefault("visual_state", {}),
-        )
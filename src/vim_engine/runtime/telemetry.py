@@ -25,6 +25,8 @@ DEFAULT_LOG_FILE = os.getenv(f"{ENV_PREFIX}LOG_FILE", "")
 DEFAULT_CHART_DIR = os.getenv(f"{ENV_PREFIX}CHART_DIR", "./.telemetry")
 
 _LOGGER_CACHE: MutableMapping[str, Any] = {}
+# Resolved level methods, keyed like _LOGGER_CACHE so both share one lifetime.
+_LEVEL_METHOD_CACHE: Dict[str, Dict[Tuple[str, bool], Tuple[Any, bool]]] = {}
 _ACTIVE_CONFIG: Optional[Any] = None
 
 
@@ -136,6 +138,7 @@ def configure(*, config: Optional[Any] = None, preset: Optional[str] = None) ->
 
     _ACTIVE_CONFIG = _apply_engine_overrides(config)
     _LOGGER_CACHE.clear()
+    _LEVEL_METHOD_CACHE.clear()
 
 
 def _ensure_config() -> Any:
@@ -149,17 +152,38 @@ def get_logger(name: Optional[str] = None) -> Any:
     """Return a cached ``telelog.Logger`` configured for this engine."""
 
     logger_name = name or DEFAULT_LOGGER_NAME
-    if logger_name not in _LOGGER_CACHE:
-        _LOGGER_CACHE[logger_name] = tl.Logger.with_config(
+    cached = _LOGGER_CACHE.get(logger_name)
+    if cached is None:
+        cached = _LOGGER_CACHE[logger_name] = tl.Logger.with_config(
             logger_name, _ensure_config()
         )
-    return _LOGGER_CACHE[logger_name]
+        _LEVEL_METHOD_CACHE[logger_name] = {}
+    return cached
 
 
 def _resolve_level_method(
-    logger: Any, level: Any, *, expect_data: bool = False
+    logger: Any,
+    level: Any,
+    *,
+    expect_data: bool = False,
+    logger_name: Optional[str] = None,
 ) -> Tuple[Any, bool]:
     name = str(level).lower()
+    methods = _LEVEL_METHOD_CACHE.get(logger_name) if logger_name else None
+    if methods is None or _LOGGER_CACHE.get(logger_name) is not logger:
+        return _lookup_level_method(logger, name, level, expect_data=expect_data)
+    key = (name, expect_data)
+    cached = methods.get(key)
+    if cached is None:
+        cached = methods[key] = _lookup_level_method(
+            logger, name, level, expect_data=expect_data
+        )
+    return cached
+
+
+def _lookup_level_method(
+    logger: Any, name: str, level: Any, *, expect_data: bool
+) -> Tuple[Any, bool]:
     if expect_data:
         with_attr = getattr(logger, f"{name}_with", None)
         if with_attr is not None:
@@ -180,9 +204,12 @@ def record_event(
 ) -> None:
     """Emit a structured event following the Telelog cookbook guidance."""
 
+    logger_name = logger_name or DEFAULT_LOGGER_NAME
     log = get_logger(logger_name)
     payload = {"event": name, **(data or {})}
-    method, accepts_data = _resolve_level_method(log, level, expect_data=True)
+    method, accepts_data = _resolve_level_method(
+        log, level, expect_data=True, logger_name=logger_name
+    )
     message = f"event::{name}"
     if accepts_data:
         method(message, _format_pairs(payload))
@@ -198,6 +225,7 @@ class SpanHandle:
     span_name: str
     component_name: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    logger_name: Optional[str] = None
 
     def add_metadata(self, key: str, value: Any) -> None:
         self.metadata[key] = _stringify(value)
@@ -211,7 +239,9 @@ class SpanHandle:
         if extra:
             payload.update({key: _stringify(val) for key, val in extra.items()})
 
-        method, accepts = _resolve_level_method(self.logger, level, expect_data=True)
+        method, accepts = _resolve_level_method(
+            self.logger, level, expect_data=True, logger_name=self.logger_name
+        )
         if accepts:
             method(message, _format_pairs(payload))
         else:
@@ -249,6 +279,7 @@ def span(
         component metadata when tracking is enabled.
     """
 
+    logger_name = logger_name or DEFAULT_LOGGER_NAME
     log = get_logger(logger_name)
     component_name = None
     if component is True:
@@ -275,6 +306,7 @@ def span(
             span_name=name,
             component_name=component_name,
             metadata=dict(metadata_payload),
+            logger_name=logger_name,
         )
 
         try:
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from vim_engine.buffer import Buffer
+
+
+def test_replace_range_splices_multiline_text() -> None:
+    buffer = Buffer.from_text("alpha\nbeta\ngamma")
+
+    delta = buffer.replace_range((0, 2), (2, 1), "X\nY", label="edit")
+
+    assert delta.text == "alX\nYamma"
+    assert buffer.document.snapshot() == ("alX", "Yamma")
+    assert buffer.state.cursor == (1, 1)
+    assert buffer.document.version == 1
+
+
+def test_insert_text_advances_cursor_on_same_line() -> None:
+    buffer = Buffer.from_text("ab")
+
+    buffer.insert_text("XY", cursor=(0, 1))
+
+    assert buffer.document.snapshot() == ("aXYb",)
+    assert buffer.state.cursor == (0, 3)
+
+
+def test_get_text_range_spans_lines_in_either_order() -> None:
+    buffer = Buffer.from_text("alpha\nbeta\ngamma")
+
+    assert buffer.get_text_range((0, 3), (2, 2)) == "ha\nbeta\nga"
+    assert buffer.get_text_range((2, 2), (0, 3)) == "ha\nbeta\nga"
+    assert buffer.get_text_range((1, 1), (1, 3)) == "et"
+
+
+def test_undo_entry_records_edit_delta() -> None:
+    buffer = Buffer.from_text("alpha\nbeta")
+
+    buffer.replace_range((0, 3), (1, 2), "-", label="edit")
+    entry = buffer.undo.undo()
+
+    assert entry is not None
+    assert entry.start == (0, 3)
+    assert entry.removed == "ha\nbe"
+    assert entry.inserted == "-"
+    assert entry.cursor_after == (0, 4)
+
+
+def test_mirror_is_not_shared_between_calls() -> None:
+    buffer = Buffer.from_text("alpha")
+
+    first = buffer.mirror()
+    first.text = "edited by host"
+    first.attributes["dirty"] = "yes"
+
+    second = buffer.mirror()
+    assert second is not first
+    assert second.text == "alpha"
+    assert second.attributes == {}
+
+
+def test_replace_range_splits_crlf_like_from_text() -> None:
+    buffer = Buffer.from_text("ab\ncd")
+
+    buffer.replace_range((0, 1), (0, 1), "X\r\nY", label="paste")
+
+    assert buffer.document.snapshot() == ("aX", "Yb", "cd")
+    assert buffer.state.cursor == (1, 1)
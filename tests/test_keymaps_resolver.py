@@ -111,3 +111,14 @@ def test_resolver_cache_refreshes_on_revision() -> None:
     assert match.status == "match"
     assert match.match is not None
     assert match.match.binding.id == new_binding.id
+
+
+def test_resolver_miss_reports_matched_prefix_length() -> None:
+    binding = make_binding("normal.gg")
+    registry = build_registry([binding])
+    resolver = KeymapResolver(registry)
+
+    result = resolver.resolve("normal", ("g", "x"))
+
+    assert result.status == "miss"
+    assert result.consumed == 1
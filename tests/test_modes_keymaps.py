@@ -4,10 +4,12 @@ from typing import Any, Dict, Optional
 
 import pytest
 
+from vim_engine.actions.command import submit_command_line
 from vim_engine.buffer import Buffer
 from vim_engine.keymaps import (
     Binding,
     KeySequence,
+    KeymapConflictError,
     KeymapRegistry,
     KeymapResolver,
     load_default_keymaps,
@@ -71,6 +73,45 @@ def test_insert_mode_escape_binding() -> None:
     assert result.consumed is True
 
 
+def test_escape_alias_conflicts_with_default_and_resolves() -> None:
+    registry = KeymapRegistry()
+    load_default_keymaps(registry)
+    resolver = KeymapResolver(registry)
+    alias = Binding(
+        id="insert.user_esc",
+        mode="insert",
+        sequence=KeySequence.from_strings("<Esc>"),
+        action_id="core.exit_to_normal",
+    )
+
+    with pytest.raises(KeymapConflictError):
+        registry.register_binding(alias)
+
+    assert alias.sequence.strokes[0].key == "<Esc>"
+    resolved = resolver.resolve("insert", ("<Esc>",))
+    assert resolved.match is not None
+    assert resolved.match.binding.id == "insert.exit_escape"
+    result = InsertMode(make_context(registry, resolver)).handle_key(
+        KeyInput(key="<Esc>")
+    )
+    assert result.switch_to == "normal"
+
+
+def test_default_filters_accept_deprecated_alias_binding_ids() -> None:
+    registry = KeymapRegistry()
+    load_default_keymaps(
+        registry,
+        include_bindings=["insert.exit_escape_alt", "command.submit_return"],
+    )
+
+    ids = {binding.id for binding in registry.iter_bindings()}
+    assert ids == {"insert.exit_escape", "command.submit_enter"}
+
+    excluded = KeymapRegistry()
+    load_default_keymaps(excluded, exclude_bindings=["visual.exit_escape_alt"])
+    assert "visual.exit_escape" in {b.id for b in excluded.iter_bindings()}
+
+
 def test_normal_mode_pending_sequence() -> None:
     registry = KeymapRegistry()
     load_default_keymaps(registry)
@@ -378,3 +419,68 @@ def test_command_mode_edit_force_event() -> None:
     mode.handle_key(KeyInput(key="ENTER"))
 
     assert edits and edits[0]["force"] is True
+
+
+def test_command_line_splits_command_on_any_whitespace() -> None:
+    registry = KeymapRegistry()
+    context = make_context(registry, KeymapResolver(registry))
+    context.command_text = "echo\thello  world"
+
+    result = submit_command_line(context, None)
+
+    assert result.status == "command_echo"
+    assert result.message == "hello world"
+
+
+def test_command_line_rejects_force_on_echo() -> None:
+    registry = KeymapRegistry()
+    context = make_context(registry, KeymapResolver(registry))
+    errors: list[str] = []
+    context.bus.subscribe("command.error", lambda payload: errors.append(payload))
+    context.command_text = "echo! hello"
+
+    result = submit_command_line(context, None)
+
+    assert result.status == "command_error"
+    assert errors == ["echo!"]
+
+
+def test_command_mode_backspace_edits_command_line() -> None:
+    registry = KeymapRegistry()
+    load_default_keymaps(registry)
+    resolver = KeymapResolver(registry)
+    context = make_context(registry, resolver)
+    mode = CommandMode(context)
+    mode.on_enter("normal")
+
+    mode.handle_key(KeyInput(key="w", text="w"))
+    mode.handle_key(KeyInput(key="x", text="x"))
+    edited = mode.handle_key(KeyInput(key="BACKSPACE"))
+
+    assert edited.status == "editing"
+    assert mode.current_command == "w"
+
+    mode.handle_key(KeyInput(key="BACKSPACE"))
+    empty = mode.handle_key(KeyInput(key="BACKSPACE"))
+
+    assert empty.consumed is False
+    assert mode.current_command == ""
+
+
+def test_mode_bus_reports_subscribers() -> None:
+    bus = ModeBus()
+    assert not bus.has_subscribers("command.write")
+
+    bus.subscribe("command.write", lambda payload: None)
+
+    assert bus.has_subscribers("command.write")
+    assert not bus.has_subscribers("command.edit")
+
+
+def test_iter_bindings_follows_registration_order() -> None:
+    registry = KeymapRegistry()
+    load_default_keymaps(registry)
+
+    expected = [b.id for b in registry.iter_bindings() if b.mode == "visual"]
+
+    assert [b.id for b in registry.iter_bindings("visual")] == expected
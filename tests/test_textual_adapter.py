@@ -52,6 +52,20 @@ def test_adapter_updates_buffer_and_status() -> None:
     assert any(status.startswith("timeout") is False for status in statuses)
 
 
+def test_adapter_coalesces_buffer_refreshes_per_key() -> None:
+    manager = make_manager()
+    updates: List[str] = []
+    hooks = TextualUIHooks(update_buffer=lambda mirror: updates.append(mirror.text))
+    adapter = TextualVimAdapter(manager, hooks)
+    assert len(updates) == 1
+
+    adapter.handle_textual_key("v")
+    assert len(updates) == 2
+
+    adapter.handle_textual_key("l")  # empty buffer: selection cannot move
+    assert len(updates) == 2
+
+
 def test_adapter_relays_command_events() -> None:
     manager = make_manager()
     command_lines: List[str] = []